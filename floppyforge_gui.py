@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import queue
+import stat
 import threading
 import time
 from pathlib import Path
@@ -15,6 +17,18 @@ from floppyforge_core import (
 )
 
 
+# 512 KiB keeps syscall counts low without starving progress updates;
+# see FloppyForgeCore for how the chunk size feeds the write loops.
+DEFAULT_CHUNK = 512 * 1024
+
+# Keep the log Text bounded so inserts stay O(1) on long operations; the
+# extra 200-line slack means trimming happens in batches, not per line.
+MAX_LOG_LINES = 2000
+
+# Hot-path constants hoisted out of the click handlers.
+_TYPICAL_FLOPPY_SIZES = frozenset((FLOPPY_720K, FLOPPY_1440K, FLOPPY_2880K, AMIGA_ADF_880K))
+_VALID_DRIVES = frozenset("AB")
+
 # Dark theme colors (unchanged)
 COLORS = {
     "bg_dark": "#1a1a1a",
@@ -65,35 +79,38 @@ class ModernButton(tk.Canvas):
         self.bind("<Leave>", self._on_leave)
         self.bind("<Button-1>", self._on_click)
 
-        self._draw()
-
-    def _draw(self):
-        self.delete("all")
-
-        if self.is_disabled:
-            color = COLORS["bg_light"]
-            text_color = COLORS["fg_secondary"]
-        else:
-            color = self.hover_bg if self.is_hovered else self.bg_color
-            text_color = self.fg_color
-
-        self.create_rectangle(
+        # Create the canvas items once; hover/state changes only itemconfig
+        # their colors instead of delete("all") + full recreation.
+        self._bg_id = self.create_rectangle(
             0,
             0,
             self.winfo_reqwidth(),
             self.winfo_reqheight(),
-            fill=color,
+            fill=self.bg_color,
             outline="",
             tags="bg",
         )
-        self.create_text(
+        self._text_id = self.create_text(
             self.winfo_reqwidth() // 2,
             self.winfo_reqheight() // 2,
             text=self.text,
-            fill=text_color,
+            fill=self.fg_color,
             font=("Segoe UI", 10, "bold"),
         )
 
+        self._draw()
+
+    def _draw(self):
+        if self.is_disabled:
+            color = COLORS["bg_light"]
+            text_color = COLORS["fg_secondary"]
+        else:
+            color = self.hover_bg if self.is_hovered else self.bg_color
+            text_color = self.fg_color
+
+        self.itemconfig(self._bg_id, fill=color)
+        self.itemconfig(self._text_id, fill=text_color)
+
     def _on_enter(self, _e):
         if not self.is_disabled:
             self.is_hovered = True
@@ -124,19 +141,43 @@ class FloppyForgeApp(tk.Tk):
         self._configure_ttk_theme()
 
         # Core instance (NEW)
-        self.core = FloppyForgeCore(chunk_size=64 * 1024)
+        self.core = FloppyForgeCore(chunk_size=DEFAULT_CHUNK)
+
+        # The platform never changes at runtime, so the idle status string
+        # is computed exactly once.
+        self._ready_status = f"Ready — OS: {self.core.platform_name()}"
 
         self.img_path_var = tk.StringVar(value="")
         self.drive_var = tk.StringVar(value="A")
         self.format_size_var = tk.StringVar(value="Auto")  # Auto / 720KB / 1.44MB
 
-        self.status_var = tk.StringVar(value=f"Ready — OS: {self.core.platform_name()}")
+        self.status_var = tk.StringVar(value=self._ready_status)
         self.bytes_written_var = tk.StringVar(value="0 B / 0 B")
         self.speed_var = tk.StringVar(value="—")
 
-        self._stop_requested = False
+        self._stop_event = threading.Event()
         self._worker_thread: threading.Thread | None = None
         self._current_op = "idle"  # "write" | "format" | "idle"
+        self._op_t0 = 0.0  # monotonic start of the running operation
+
+        # All worker -> GUI traffic goes through one queue drained by a
+        # single ~30 Hz timer while an operation runs, instead of one
+        # after(0, ...) hop through Tcl's event queue per event. The
+        # drainer coalesces progress to the newest tuple and batches logs.
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._drain_scheduled = False
+
+        # strftime result cached per wall-clock second; chatty logging
+        # reuses the string instead of re-running the locale machinery.
+        self._ts_second = 0
+        self._ts_cached = ""
+
+        # Cached progress strings: the total never changes during an
+        # operation and the human-readable written value changes far less
+        # often than the callbacks arrive.
+        self._total_human = "0 B"
+        self._last_written_human = ""
+        self._last_pct_tenths = -1
 
         self._build_ui()
         self._apply_app_icon()
@@ -147,45 +188,36 @@ class FloppyForgeApp(tk.Tk):
         style = ttk.Style()
         style.theme_use("clam")
 
-        style.configure("Dark.TFrame", background=COLORS["bg_dark"])
-        style.configure("Card.TFrame", background=COLORS["bg_medium"])
-        style.configure(
-            "Dark.TLabel",
-            background=COLORS["bg_dark"],
-            foreground=COLORS["fg_primary"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Card.TLabel",
-            background=COLORS["bg_medium"],
-            foreground=COLORS["fg_primary"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Title.TLabel",
-            background=COLORS["bg_dark"],
-            foreground=COLORS["accent"],
-            font=("Segoe UI", 18, "bold"),
-        )
-        style.configure(
-            "Subtitle.TLabel",
-            background=COLORS["bg_dark"],
-            foreground=COLORS["fg_secondary"],
-            font=("Segoe UI", 9),
-        )
-        style.configure(
-            "Status.TLabel",
-            background=COLORS["bg_medium"],
-            foreground=COLORS["accent"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Dark.Horizontal.TProgressbar",
-            background=COLORS["accent"],
-            troughcolor=COLORS["bg_light"],
-            borderwidth=0,
-            thickness=8,
-        )
+        # One declarative table, one configure loop: the dicts are built up
+        # front so Tcl sees a plain stream of configure commands with no
+        # Python-side formatting interleaved.
+        dark_label = {"background": COLORS["bg_dark"], "font": ("Segoe UI", 10)}
+        card_label = {"background": COLORS["bg_medium"], "font": ("Segoe UI", 10)}
+        styles = {
+            "Dark.TFrame": {"background": COLORS["bg_dark"]},
+            "Card.TFrame": {"background": COLORS["bg_medium"]},
+            "Dark.TLabel": {**dark_label, "foreground": COLORS["fg_primary"]},
+            "Card.TLabel": {**card_label, "foreground": COLORS["fg_primary"]},
+            "Title.TLabel": {
+                **dark_label,
+                "foreground": COLORS["accent"],
+                "font": ("Segoe UI", 18, "bold"),
+            },
+            "Subtitle.TLabel": {
+                **dark_label,
+                "foreground": COLORS["fg_secondary"],
+                "font": ("Segoe UI", 9),
+            },
+            "Status.TLabel": {**card_label, "foreground": COLORS["accent"]},
+            "Dark.Horizontal.TProgressbar": {
+                "background": COLORS["accent"],
+                "troughcolor": COLORS["bg_light"],
+                "borderwidth": 0,
+                "thickness": 8,
+            },
+        }
+        for name, kw in styles.items():
+            style.configure(name, **kw)
 
     def _apply_app_icon(self) -> None:
         """
@@ -393,6 +425,13 @@ class FloppyForgeApp(tk.Tk):
         )
         self.log.pack(side="left", fill="both", expand=True, padx=10, pady=10)
 
+        # Register the level colors once; log_line only references tags by
+        # name instead of re-configuring them per line.
+        self.log.tag_config("info", foreground=COLORS["accent"])
+        self.log.tag_config("ok", foreground=COLORS["success"])
+        self.log.tag_config("warn", foreground=COLORS["warning"])
+        self.log.tag_config("err", foreground=COLORS["error"])
+
         scroll = tk.Scrollbar(
             log_frame,
             command=self.log.yview,
@@ -422,35 +461,30 @@ class FloppyForgeApp(tk.Tk):
 
     # ---------------- Logging + helpers ----------------
 
+    def _timestamp(self, when: float | None = None) -> str:
+        # Tk thread only: the per-second cache is unsynchronized.
+        now = int(time.time() if when is None else when)
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_cached = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._ts_cached
+
     def log_line(self, msg: str, level: str = "info") -> None:
         """
         level: info | ok | warn | err
         """
-        ts = time.strftime("%H:%M:%S")
-
-        color = None
-        if level == "ok":
-            color = COLORS["success"]
-        elif level == "warn":
-            color = COLORS["warning"]
-        elif level == "err":
-            color = COLORS["error"]
-        elif level == "info":
-            color = COLORS["accent"]
-
-        tag = None
-        if color:
-            tag = f"color_{color}"
-            self.log.tag_config(tag, foreground=color)
-
-        if tag:
-            self.log.insert("end", f"[{ts}] ", tag)
-            self.log.insert("end", f"{msg}\n", tag)
-        else:
-            self.log.insert("end", f"[{ts}] {msg}\n")
-
+        ts = self._timestamp()
+        tag = level if level in ("info", "ok", "warn", "err") else "info"
+        # one insert = one Tcl crossing per line (tags registered in _build_ui)
+        self.log.insert("end", f"[{ts}] {msg}\n", tag)
+        self._trim_log()
         self.log.see("end")
 
+    def _trim_log(self) -> None:
+        count = int(self.log.index("end-1c").split(".")[0])
+        if count > MAX_LOG_LINES + 200:
+            self.log.delete("1.0", f"{count - MAX_LOG_LINES}.0")
+
     def clear_log(self) -> None:
         self.log.delete("1.0", "end")
 
@@ -468,7 +502,7 @@ class FloppyForgeApp(tk.Tk):
             self.img_path_var.set(path)
 
     def request_stop(self) -> None:
-        self._stop_requested = True
+        self._stop_event.set()
         self.status_var.set("Stop requested…")
         self.log_line("Stop requested by user", "warn")
 
@@ -477,11 +511,9 @@ class FloppyForgeApp(tk.Tk):
         self.format_btn.config_state("disabled" if busy else "normal")
         self.stop_btn.config_state("normal" if busy else "disabled")
 
-    def _stop_cb(self) -> bool:
-        return self._stop_requested
-
-    def _progress_cb(self, written: int, total: int, t0: float) -> None:
-        self.after(0, self._update_progress, written, total, t0)
+    def _progress_cb(self, written: int, total: int) -> None:
+        # Worker thread: enqueue only, no Tcl crossing.
+        self._ui_queue.put(("progress", (written, total)))
 
     def _core_log_cb(self, msg: str, level: str = "info") -> None:
         """
@@ -490,7 +522,53 @@ class FloppyForgeApp(tk.Tk):
         """
         if level not in ("info", "warn", "err", "ok"):
             level = "info"
-        self.after(0, self.log_line, msg, level)
+        # Worker thread: capture the raw time only; formatting (and the
+        # per-second cache it shares with log_line) stays on the Tk thread.
+        self._ui_queue.put(("log", (time.time(), msg, level)))
+
+    def _start_ui_drain(self) -> None:
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.after(33, self._drain_ui)
+
+    def _drain_ui(self) -> None:
+        self._drain_scheduled = False
+        latest_progress: tuple[int, int] | None = None
+        logs: list[tuple[float, str, str]] = []
+        while True:
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                latest_progress = payload
+            else:
+                logs.append(payload)
+
+        if logs:
+            self._insert_log_batch(logs)
+        if latest_progress is not None:
+            self._update_progress(*latest_progress)
+
+        # Keep ticking only while a worker is running; _on_worker_done does
+        # one final drain for anything queued after the last tick.
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            self._start_ui_drain()
+
+    def _insert_log_batch(self, entries: list[tuple[float, str, str]]) -> None:
+        # One insert per run of same-level lines, one scroll at the end.
+        run: list[str] = []
+        run_level = entries[0][2]
+        for when, msg, level in entries:
+            if level != run_level:
+                self.log.insert("end", "".join(run), run_level)
+                run = []
+                run_level = level
+            run.append(f"[{self._timestamp(when)}] {msg}\n")
+        if run:
+            self.log.insert("end", "".join(run), run_level)
+        self._trim_log()
+        self.log.see("end")
 
     def _resolve_format_size(self) -> int:
         opt = self.format_size_var.get().strip()
@@ -507,13 +585,14 @@ class FloppyForgeApp(tk.Tk):
                 return s
         return FLOPPY_1440K
 
+    _OP_STATUS_PREFIX = {"write": "Writing… ", "format": "Formatting… "}
+
     def _set_op_status(self, pct: float) -> None:
-        if self._current_op == "write":
-            self.status_var.set(f"Writing… {pct:.1f}%")
-        elif self._current_op == "format":
-            self.status_var.set(f"Formatting… {pct:.1f}%")
+        prefix = self._OP_STATUS_PREFIX.get(self._current_op)
+        if prefix is None:
+            self.status_var.set(self._ready_status)
         else:
-            self.status_var.set(f"Ready — OS: {self.core.platform_name()}")
+            self.status_var.set(f"{prefix}{pct:.1f}%")
 
     def _check_device_access(self, drive: str) -> bool:
         """
@@ -537,19 +616,25 @@ class FloppyForgeApp(tk.Tk):
             return
 
         image_path = Path(self.img_path_var.get().strip())
-        if not image_path.exists() or not image_path.is_file():
+        # One stat() answers existence, type and size in a single syscall
+        # (and can't race against a rename between separate checks).
+        try:
+            st = image_path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             messagebox.showerror("Error", "Please select a valid .img or .adf file.")
             return
 
         drive = self.drive_var.get().strip().upper()
-        if drive not in ("A", "B"):
+        if drive not in _VALID_DRIVES:
             messagebox.showerror("Error", "Please select a valid drive (A or B).")
             return
 
         if not self._check_device_access(drive):
             return
 
-        size = image_path.stat().st_size
+        size = st.st_size
         if size == 0:
             messagebox.showerror("Error", "Selected image file is empty.")
             return
@@ -557,8 +642,7 @@ class FloppyForgeApp(tk.Tk):
         suffix = image_path.suffix.lower()
         is_adf = (suffix == ".adf")
 
-        typical_sizes = {FLOPPY_720K, FLOPPY_1440K, FLOPPY_2880K, AMIGA_ADF_880K}
-        if size not in typical_sizes:
+        if size not in _TYPICAL_FLOPPY_SIZES:
             if not messagebox.askyesno(
                 "Unusual Image Size",
                 f"The image is {size} bytes.\n"
@@ -583,13 +667,17 @@ class FloppyForgeApp(tk.Tk):
         ):
             return
 
-        self._stop_requested = False
+        self._stop_event.clear()
         self._set_ui_busy(True)
         self.progress["value"] = 0
-        self.bytes_written_var.set(f"0 B / {self.core.human_bytes(size)}")
+        self._total_human = self.core.human_bytes(size)
+        self._last_written_human = ""
+        self._last_pct_tenths = -1
+        self.bytes_written_var.set(f"0 B / {self._total_human}")
         self.speed_var.set("—")
 
         self._current_op = "write"
+        self._op_t0 = time.monotonic()
         self._set_op_status(0.0)
 
         self.log_line(f"Image: {image_path}", "info")
@@ -602,7 +690,7 @@ class FloppyForgeApp(tk.Tk):
             daemon=True,
         )
         self._worker_thread.start()
-        self.after(100, self._poll_thread)
+        self._start_ui_drain()
 
     def start_format(self) -> None:
         if self._worker_thread and self._worker_thread.is_alive():
@@ -610,7 +698,7 @@ class FloppyForgeApp(tk.Tk):
             return
 
         drive = self.drive_var.get().strip().upper()
-        if drive not in ("A", "B"):
+        if drive not in _VALID_DRIVES:
             messagebox.showerror("Error", "Please select a valid drive (A or B).")
             return
 
@@ -627,13 +715,17 @@ class FloppyForgeApp(tk.Tk):
         ):
             return
 
-        self._stop_requested = False
+        self._stop_event.clear()
         self._set_ui_busy(True)
         self.progress["value"] = 0
-        self.bytes_written_var.set(f"0 B / {self.core.human_bytes(size)}")
+        self._total_human = self.core.human_bytes(size)
+        self._last_written_human = ""
+        self._last_pct_tenths = -1
+        self.bytes_written_var.set(f"0 B / {self._total_human}")
         self.speed_var.set("—")
 
         self._current_op = "format"
+        self._op_t0 = time.monotonic()
         self._set_op_status(0.0)
 
         self.log_line(f"Format on drive {drive}: {self.core.human_bytes(size)}", "warn")
@@ -645,81 +737,89 @@ class FloppyForgeApp(tk.Tk):
             daemon=True,
         )
         self._worker_thread.start()
-        self.after(100, self._poll_thread)
+        self._start_ui_drain()
 
     # ---------------- Thread workers ----------------
 
     def _write_worker(self, image_path: Path, drive: str) -> None:
-        t0 = time.time()
-
-        def progress_cb(written: int, total: int) -> None:
-            self._progress_cb(written, total, t0)
-
         try:
             self.core.write_image(
                 image_path=image_path,
                 drive_letter=drive,
-                stop_cb=self._stop_cb,
-                progress_cb=progress_cb,
+                stop_cb=self._stop_event.is_set,
+                progress_cb=self._progress_cb,
                 log_cb=self._core_log_cb,
             )
             self.after(0, self._finish_ok, "Write completed successfully.")
         except Exception as e:
             err = self.core.format_error(e)
             self.after(0, self._finish_err, err)
+        finally:
+            self.after(0, self._on_worker_done)
 
     def _format_worker(self, drive: str, size: int) -> None:
-        t0 = time.time()
-
-        def progress_cb(written: int, total: int) -> None:
-            self._progress_cb(written, total, t0)
-
         try:
             self.core.format_zero_fill(
                 size=size,
                 drive_letter=drive,
-                stop_cb=self._stop_cb,
-                progress_cb=progress_cb,
+                stop_cb=self._stop_event.is_set,
+                progress_cb=self._progress_cb,
                 log_cb=self._core_log_cb,
             )
             self.after(0, self._finish_ok, "Format completed successfully.")
         except Exception as e:
             err = self.core.format_error(e)
             self.after(0, self._finish_err, err)
-
-    def _poll_thread(self) -> None:
-        if self._worker_thread and self._worker_thread.is_alive():
-            self.after(150, self._poll_thread)
-        else:
-            self._set_ui_busy(False)
-            self._current_op = "idle"
-            self._set_op_status(0.0)
+        finally:
+            self.after(0, self._on_worker_done)
+
+    def _on_worker_done(self) -> None:
+        # Posted by the worker itself when the core call returns, so the
+        # event loop no longer has to poll is_alive() on a timer.
+        self._drain_ui()
+        self._set_ui_busy(False)
+        self._current_op = "idle"
+        self._set_op_status(0.0)
 
     # ---------------- UI updates ----------------
 
-    def _update_progress(self, written: int, total: int, t0: float) -> None:
+    def _update_progress(self, written: int, total: int) -> None:
         if total <= 0:
             return
 
         pct = (written / total) * 100.0
         pct = min(max(pct, 0.0), 100.0)
 
-        self.progress["value"] = pct
-        self.bytes_written_var.set(f"{self.core.human_bytes(written)} / {self.core.human_bytes(total)}")
+        # Only touch the Tcl side when the visible value actually changed.
+        pct_tenths = int(pct * 10)
+        if pct_tenths != self._last_pct_tenths:
+            self._last_pct_tenths = pct_tenths
+            self.progress["value"] = pct
+
+        w_human = self.core.human_bytes(written)
+        if w_human != self._last_written_human:
+            self._last_written_human = w_human
+            self.bytes_written_var.set(f"{w_human} / {self._total_human}")
 
-        dt = max(time.time() - t0, 0.001)
+        dt = max(time.monotonic() - self._op_t0, 0.001)
         speed = written / dt
         self.speed_var.set(f"{self.core.human_bytes(int(speed))}/s")
 
         self._set_op_status(pct)
 
     def _finish_ok(self, msg: str) -> None:
+        # Flush the worker's last queued log lines (e.g. "fsync complete")
+        # so the terminal message lands below them, not above.
+        self._drain_ui()
         self.progress["value"] = 100
         self.status_var.set("✓ Completed Successfully")
         self.log_line(f"SUCCESS: {msg}", "ok")
         messagebox.showinfo("Success", msg)
 
     def _finish_err(self, err: str) -> None:
+        # Render the context lines queued by the worker before the
+        # error dialog blocks the event loop.
+        self._drain_ui()
         self.status_var.set("✗ Error occurred")
         self.log_line(f"ERROR: {err}", "err")
         messagebox.showerror(